@@ -1,6 +1,8 @@
 import os
-import math
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple
 
@@ -14,6 +16,18 @@ try:
 except Exception:  # pragma: no cover - optional runtime dep
     Image = ImageDraw = ImageFont = None
 
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - optional runtime dep
+    np = None
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional runtime dep
+    orjson = None
+
+DEFAULT_FONT = ImageFont.load_default() if ImageFont else None
+
 ROOT = Path(__file__).resolve().parents[1]
 SVG_DIR = ROOT / "badges" / "svg"
 PNG_DIR = ROOT / "badges" / "png"
@@ -36,7 +50,7 @@ HEIGHT = 20
 RADIUS = 5
 PNG_SCALES = {"1x": 1.0, "2x": 2.0}  # label -> scale factor for raster exports
 PADDING = 10
-CHAR_WIDTH = 7.0  # rough average for the selected typeface
+CHAR_WIDTH = 7  # rough average for the selected typeface, in whole pixels
 FONT_FAMILY = "Inter, 'Segoe UI', 'Helvetica Neue', Arial, sans-serif"
 RIGHT_FILL = "#111827"
 RIGHT_TEXT = "#E5E7EB"
@@ -48,14 +62,58 @@ OUTLINE_RGBA = (13, 18, 34, 255)
 DARK_GRADIENT_START = "#0f1628"
 DARK_GRADIENT_END = "#0b1020"
 
+_SLUG_TRANS = str.maketrans({"–": "-", "—": "-", "•": "-", "/": "-"})
+_SLUG_STRIP = re.compile(r"[^a-z0-9-]+")
+_SLUG_COLLAPSE = re.compile(r"-{2,}")
+
+if np is not None:
+    # Unit vectors for the 10 sparkle vertices (alternating outer/inner), starting at 12 o'clock.
+    _STAR_ANGLES = np.radians(36 * np.arange(10) - 90)
+    _STAR_COS = np.cos(_STAR_ANGLES)
+    _STAR_SIN = np.sin(_STAR_ANGLES)
+
+_SVG_BASELINE = 14  # visually centered for 20px height with default font
+_SVG_SPARKLE_PATH = "M9 2l1.1 3.4L13.5 6 10.1 7.6 9 11 7.9 7.6 4.5 6 7.9 5.4 9 2z"
+# Design constants are baked in once; build_svg only fills the per-badge fields.
+# The body is kept separate from the <svg> wrapper so the sprite can reuse it as-is.
+_SVG_HEADER = f"""
+<svg xmlns='http://www.w3.org/2000/svg' width='{{total_width}}' height='{HEIGHT}' role='img' aria-label='{{label}}'>"""
+_SVG_BODY = f"""
+  <title>{{label}}</title>
+  <defs>
+    <clipPath id='clip-{{slug}}'>
+      <rect rx='{RADIUS}' width='{{total_width}}' height='{HEIGHT}' />
+    </clipPath>
+    <linearGradient id='grad-ai-{{slug}}' x1='0%' y1='0%' x2='100%' y2='100%'>
+      <stop offset='0%' stop-color='{GRADIENT_START}'/>
+      <stop offset='100%' stop-color='{GRADIENT_END}'/>
+    </linearGradient>
+    <linearGradient id='grad-dark-{{slug}}' x1='0%' y1='0%' x2='0%' y2='100%'>
+      <stop offset='0%' stop-color='{DARK_GRADIENT_START}'/>
+      <stop offset='100%' stop-color='{DARK_GRADIENT_END}'/>
+    </linearGradient>
+  </defs>
+  <g clip-path='url(#clip-{{slug}})' shape-rendering='crispEdges'>
+    <rect rx='{RADIUS}' width='{{total_width}}' height='{HEIGHT}' fill='url(#grad-dark-{{slug}})' stroke='{DARK_STROKE}' stroke-width='1' stroke-linejoin='round' />
+    <path d='M {RADIUS} 0 A {RADIUS} {RADIUS} 0 0 0 0 {RADIUS} L 0 {HEIGHT - RADIUS} A {RADIUS} {RADIUS} 0 0 0 {RADIUS} {HEIGHT} L {LEFT_WIDTH} {HEIGHT} L {LEFT_WIDTH} 0 Z' fill='url(#grad-ai-{{slug}})' stroke='{OUTLINE}' stroke-width='1' stroke-linejoin='round' />
+  </g>
+  <g fill='none' stroke='rgba(255,255,255,0.08)'>
+    <path d='M {LEFT_WIDTH} 1.5 V {HEIGHT - 1.5}'/>
+  </g>
+  <g>
+    <path d='{_SVG_SPARKLE_PATH}' fill='#FDF7FF' transform='translate(8 5) scale(0.6)'/>
+    <text x='{LEFT_WIDTH/2 + 4:.1f}' y='{_SVG_BASELINE}' text-anchor='middle' fill='#FFFFFF' font-family=\"{FONT_FAMILY}\" font-size='11' font-weight='600'>AI</text>
+    <text x='{LEFT_WIDTH + PADDING}' y='{_SVG_BASELINE}' fill='{RIGHT_TEXT}' font-family=\"{FONT_FAMILY}\" font-size='11' font-weight='500'>{{label}}</text>
+  </g>
+"""
+_SVG_FOOTER = "</svg>\n"
+
 
+@lru_cache(maxsize=None)
 def slugify(label: str) -> str:
-    import re
-
-    slug = label.lower()
-    slug = slug.replace("–", "-").replace("—", "-").replace("•", "-").replace("/", "-")
-    slug = re.sub(r"[^a-z0-9-]+", "-", slug)
-    slug = re.sub(r"-{2,}", "-", slug).strip("-")
+    slug = label.lower().translate(_SLUG_TRANS)
+    slug = _SLUG_STRIP.sub("-", slug)
+    slug = _SLUG_COLLAPSE.sub("-", slug).strip("-")
     return slug
 
 
@@ -64,49 +122,48 @@ def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
 
 
+def gradient_rgb(start_hex: str, end_hex: str, steps: int):
+    # Linearly interpolated colors between two endpoints, shape (steps, 3).
+    start = np.array(hex_to_rgb(start_hex), dtype=np.float32)
+    end = np.array(hex_to_rgb(end_hex), dtype=np.float32)
+    t = np.linspace(0, 1, steps, dtype=np.float32)[:, None]
+    return (start + (end - start) * t).astype(np.uint8)
+
+
+def gradient_rgba(start_hex: str, end_hex: str, width: int, height: int):
+    # Horizontal gradient between two colors as an opaque RGBA image, built in one vectorized pass.
+    rgb = np.broadcast_to(gradient_rgb(start_hex, end_hex, width)[None, :, :], (height, width, 3))
+    alpha = np.full((height, width, 1), 255, dtype=np.uint8)
+    return Image.fromarray(np.concatenate([rgb, alpha], axis=2), "RGBA")
+
+
+@lru_cache(maxsize=32)
+def load_font(name: str, size: int, fallback=None):
+    # Cached per (name, size) so repeated badge/scale renders skip re-parsing the font file.
+    fallback = fallback or DEFAULT_FONT
+    try:
+        return ImageFont.truetype(name, size)
+    except Exception:
+        try:
+            # Try bundled PIL fonts
+            candidate = Path(ImageFont.__file__).with_name(name)
+            return ImageFont.truetype(candidate, size)
+        except Exception:
+            return fallback
+
+
 def text_width(text: str) -> int:
     # Keeps sizing predictable without font lookup.
-    return math.ceil(len(text) * CHAR_WIDTH)
+    return len(text) * CHAR_WIDTH
 
 
-def build_svg(label: str) -> str:
+def build_svg(label: str) -> Tuple[str, str, int]:
     slug = slugify(label)
     right_width = PADDING * 2 + text_width(label)
     total_width = LEFT_WIDTH + right_width
-    baseline = 14  # visually centered for 20px height with default font
-
-    sparkle_path = "M9 2l1.1 3.4L13.5 6 10.1 7.6 9 11 7.9 7.6 4.5 6 7.9 5.4 9 2z"
-
-    return f"""
-<svg xmlns='http://www.w3.org/2000/svg' width='{total_width}' height='{HEIGHT}' role='img' aria-label='{label}'>
-  <title>{label}</title>
-  <defs>
-    <clipPath id='clip-{slug}'>
-      <rect rx='{RADIUS}' width='{total_width}' height='{HEIGHT}' />
-    </clipPath>
-    <linearGradient id='grad-ai-{slug}' x1='0%' y1='0%' x2='100%' y2='100%'>
-      <stop offset='0%' stop-color='{GRADIENT_START}'/>
-      <stop offset='100%' stop-color='{GRADIENT_END}'/>
-    </linearGradient>
-    <linearGradient id='grad-dark-{slug}' x1='0%' y1='0%' x2='0%' y2='100%'>
-      <stop offset='0%' stop-color='{DARK_GRADIENT_START}'/>
-      <stop offset='100%' stop-color='{DARK_GRADIENT_END}'/>
-    </linearGradient>
-  </defs>
-  <g clip-path='url(#clip-{slug})' shape-rendering='crispEdges'>
-    <rect rx='{RADIUS}' width='{total_width}' height='{HEIGHT}' fill='url(#grad-dark-{slug})' stroke='{DARK_STROKE}' stroke-width='1' stroke-linejoin='round' />
-    <path d='M {RADIUS} 0 A {RADIUS} {RADIUS} 0 0 0 0 {RADIUS} L 0 {HEIGHT - RADIUS} A {RADIUS} {RADIUS} 0 0 0 {RADIUS} {HEIGHT} L {LEFT_WIDTH} {HEIGHT} L {LEFT_WIDTH} 0 Z' fill='url(#grad-ai-{slug})' stroke='{OUTLINE}' stroke-width='1' stroke-linejoin='round' />
-  </g>
-  <g fill='none' stroke='rgba(255,255,255,0.08)'>
-    <path d='M {LEFT_WIDTH} 1.5 V {HEIGHT - 1.5}'/>
-  </g>
-  <g>
-    <path d='{sparkle_path}' fill='#FDF7FF' transform='translate(8 5) scale(0.6)'/>
-    <text x='{LEFT_WIDTH/2 + 4:.1f}' y='{baseline}' text-anchor='middle' fill='#FFFFFF' font-family=\"{FONT_FAMILY}\" font-size='11' font-weight='600'>AI</text>
-    <text x='{LEFT_WIDTH + PADDING}' y='{baseline}' fill='{RIGHT_TEXT}' font-family=\"{FONT_FAMILY}\" font-size='11' font-weight='500'>{label}</text>
-  </g>
-</svg>
-"""
+    inner = _SVG_BODY.format(label=label, slug=slug, total_width=total_width)
+    svg = _SVG_HEADER.format(label=label, total_width=total_width) + inner + _SVG_FOOTER
+    return svg, inner, total_width
 
 
 def write_svg(label: str, svg: str) -> Path:
@@ -116,99 +173,97 @@ def write_svg(label: str, svg: str) -> Path:
     return path
 
 
-def write_png(svg_path: Path, width: int, height: int, label: str, scale_label: str, scale: float) -> Path:
+def measure_text(draw, text: str, font) -> Tuple[int, int]:
+    try:
+        bbox = draw.textbbox((0, 0), text, font=font)
+        return bbox[2] - bbox[0], bbox[3] - bbox[1]
+    except Exception:
+        return font.getsize(text)  # type: ignore[attr-defined]
+
+
+def star_points(center: Tuple[float, float], outer: float, inner: float) -> List[Tuple[float, float]]:
+    cx, cy = center
+    r = np.where(np.arange(10) % 2 == 0, outer, inner)
+    xs = cx + r * _STAR_COS
+    ys = cy + r * _STAR_SIN
+    return list(zip(xs.tolist(), ys.tolist()))
+
+
+@lru_cache(maxsize=8)
+def left_chip(left_px: int, height: int, radius: int):
+    # Label-independent, so every badge at the same scale shares one gradient and mask.
+    gradient = gradient_rgba(GRADIENT_START, GRADIENT_END, left_px, height)
+    mask = Image.new("L", (left_px, height), 0)
+    m_draw = ImageDraw.Draw(mask)
+    # Rounded left corners only: square off the right side after the rounded fill
+    m_draw.rounded_rectangle([(0, 0), (left_px - 1, height - 1)], radius=radius, fill=255)
+    m_draw.rectangle([(radius, 0), (left_px - 1, height - 1)], fill=255)
+    return gradient, mask
+
+
+def png_path_for(svg_path: Path, scale_label: str) -> Path:
     target_dir = PNG_DIR / scale_label
     target_dir.mkdir(parents=True, exist_ok=True)
-    png_path = target_dir / f"{svg_path.stem}.png"
+    return target_dir / f"{svg_path.stem}.png"
 
-    if cairosvg:
-        try:
-            cairosvg.svg2png(url=str(svg_path), write_to=str(png_path), output_width=width, output_height=height)
-            return png_path
-        except Exception:
-            print(f"[fallback] cairosvg failed for {svg_path.name}; using Pillow renderer")
 
-    if Image is None:
-        print(f"[skip] Pillow not available; PNG not written for {svg_path.name}")
+def write_png(svg_path: Path, svg: str, width: int, height: int, label: str, scale_label: str, scale: float) -> Path:
+    png_path = png_path_for(svg_path, scale_label)
+    if cairosvg and _write_png_cairosvg(svg_path, svg, width, height, png_path):
         return png_path
+    _write_png_fallback(svg_path, width, height, label, scale, png_path)
+    return png_path
 
-    # Pillow rendering fallback (approximate the SVG look)
-    def measure(text: str, font) -> Tuple[int, int]:
-        try:
-            bbox = draw.textbbox((0, 0), text, font=font)
-            return bbox[2] - bbox[0], bbox[3] - bbox[1]
-        except Exception:
-            return font.getsize(text)  # type: ignore[attr-defined]
 
-    def load_font(name: str, size: int, fallback=None):
-        fallback = fallback or ImageFont.load_default()
-        try:
-            return ImageFont.truetype(name, size)
-        except Exception:
-            try:
-                # Try bundled PIL fonts
-                from pathlib import Path as _Path
+def _write_png_fallback(svg_path: Path, width: int, height: int, label: str, scale: float, png_path: Path) -> None:
+    if Image is None or np is None:
+        print(f"[skip] Pillow/NumPy not available; PNG not written for {svg_path.name}")
+        return
+    _write_png_pillow(width, height, label, scale, png_path)
+
+
+def _write_png_cairosvg(svg_path: Path, svg: str, width: int, height: int, png_path: Path) -> bool:
+    try:
+        # Rasterize the in-memory SVG rather than reading svg_path back from disk.
+        cairosvg.svg2png(
+            bytestring=svg.encode("utf-8"), write_to=str(png_path), output_width=width, output_height=height
+        )
+        return True
+    except Exception:
+        print(f"[fallback] cairosvg failed for {svg_path.name}; using Pillow renderer")
+        return False
 
-                candidate = _Path(ImageFont.__file__).with_name(name)
-                return ImageFont.truetype(candidate, size)
-            except Exception:
-                return fallback
 
+def _write_png_pillow(width: int, height: int, label: str, scale: float, png_path: Path) -> None:
+    # Pillow rendering fallback (approximate the SVG look)
     scale_factor = height / HEIGHT
     left_px = int(LEFT_WIDTH * scale_factor)
     pad_px = int(PADDING * scale_factor)
     radius = max(2, int(RADIUS * scale_factor))
 
-    # Start with transparent background
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    # Draw rounded background for right section with dark gradient
-    dark_bg = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    dark_draw = ImageDraw.Draw(dark_bg)
-    # Create vertical dark gradient for the right section
-    dark_start_r, dark_start_g, dark_start_b = hex_to_rgb(DARK_GRADIENT_START)
-    dark_end_r, dark_end_g, dark_end_b = hex_to_rgb(DARK_GRADIENT_END)
-    for y in range(height):
-        t = y / float(max(height - 1, 1))
-        r = int(dark_start_r + (dark_end_r - dark_start_r) * t)
-        g = int(dark_start_g + (dark_end_g - dark_start_g) * t)
-        b = int(dark_start_b + (dark_end_b - dark_start_b) * t)
-        dark_draw.line([(0, y), (width, y)], fill=(r, g, b, 255))
-    # Create mask for rounded rectangle
+    # Rounded background with vertical dark gradient, written straight into the pixel buffer;
+    # everything outside the rounded-rectangle mask stays transparent.
     dark_mask = Image.new("L", (width, height), 0)
     dark_mask_draw = ImageDraw.Draw(dark_mask)
     dark_mask_draw.rounded_rectangle([(0, 0), (width - 1, height - 1)], radius=radius, fill=255)
-    img.paste(dark_bg, (0, 0), dark_mask)
+    alpha = np.asarray(dark_mask)
+    pixels = np.empty((height, width, 4), dtype=np.uint8)
+    pixels[:, :, :3] = gradient_rgb(DARK_GRADIENT_START, DARK_GRADIENT_END, height)[:, None, :]
+    pixels[:, :, 3] = alpha
+    pixels[alpha == 0] = 0
+    img = Image.fromarray(pixels, "RGBA")
+    draw = ImageDraw.Draw(img)
     # Draw dark stroke around entire badge
     dark_stroke_rgba = hex_to_rgb(DARK_STROKE) + (255,)
     draw.rounded_rectangle([(0, 0), (width - 1, height - 1)], radius=radius, outline=dark_stroke_rgba, width=1)
 
     # Gradient for left chip
-    start_r, start_g, start_b = hex_to_rgb(GRADIENT_START)
-    end_r, end_g, end_b = hex_to_rgb(GRADIENT_END)
-    gradient = Image.new("RGBA", (left_px, height))
-    g_draw = ImageDraw.Draw(gradient)
-    for x in range(left_px):
-        t = x / float(max(left_px - 1, 1))
-        r = int(start_r + (end_r - start_r) * t)
-        g = int(start_g + (end_g - start_g) * t)
-        b = int(start_b + (end_b - start_b) * t)
-        g_draw.line([(x, 0), (x, height)], fill=(r, g, b, 255))
-    mask = Image.new("L", (left_px, height), 0)
-    m_draw = ImageDraw.Draw(mask)
-    # Square body
-    m_draw.rectangle([(radius, 0), (left_px - 1, height - 1)], fill=255)
-    m_draw.rectangle([(0, radius), (left_px - 1, height - radius - 1)], fill=255)
-    # Rounded left corners only
-    m_draw.pieslice([0, 0, radius * 2, radius * 2], 180, 270, fill=255)
-    m_draw.pieslice([0, height - radius * 2, radius * 2, height], 90, 180, fill=255)
+    gradient, mask = left_chip(left_px, height, radius)
     img.paste(gradient, (0, 0), mask)
     # Outline on the gradient chip (left rounded, right straight)
     # Draw outline as segments to match the left-rounded shape
-    from PIL import ImageDraw as ID
     outline_img = Image.new("RGBA", (left_px, height), (0, 0, 0, 0))
-    outline_draw = ID.Draw(outline_img)
+    outline_draw = ImageDraw.Draw(outline_img)
     # Create the outline path matching the left-rounded shape
     outline_draw.arc([0, 0, radius * 2, radius * 2], 180, 270, fill=OUTLINE_RGBA, width=1)  # top-left arc
     outline_draw.arc([0, height - radius * 2, radius * 2, height], 90, 180, fill=OUTLINE_RGBA, width=1)  # bottom-left arc
@@ -222,15 +277,6 @@ def write_png(svg_path: Path, width: int, height: int, label: str, scale_label:
     draw.line([(left_px, 1), (left_px, height - 2)], fill=(255, 255, 255, 20))
 
     # Sparkle icon
-    def star_points(center: Tuple[float, float], outer: float, inner: float) -> List[Tuple[float, float]]:
-        cx, cy = center
-        pts = []
-        for i in range(10):
-            angle = math.radians(36 * i - 90)
-            r = outer if i % 2 == 0 else inner
-            pts.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
-        return pts
-
     draw.polygon(star_points((6 * scale, height / 2), 3.0 * scale, 1.25 * scale), fill=(253, 247, 255, 255))
 
     # Text
@@ -241,25 +287,21 @@ def write_png(svg_path: Path, width: int, height: int, label: str, scale_label:
     font = load_font("DejaVuSans-Bold.ttf", ai_font_px)
 
     ai_text = "AI"
-    ai_w, ai_h = measure(ai_text, font)
+    ai_w, ai_h = measure_text(draw, ai_text, font)
     draw.text(((left_px - ai_w) / 2, (height - ai_h) / 2), ai_text, font=font, fill=(255, 255, 255, 255))
 
-    font_body = load_font("DejaVuSans-Bold.ttf", body_font_px, fallback=font)
-    _, text_h = measure(label, font_body)
+    font_body = font if body_font_px == ai_font_px else load_font("DejaVuSans-Bold.ttf", body_font_px, fallback=font)
+    _, text_h = measure_text(draw, label, font_body)
     draw.text((left_px + pad_px, (height - text_h) / 2), label, font=font_body, fill=(255, 255, 255, 255))
 
-    img.save(png_path)
-    return png_path
+    # Fast deflate: these are small build artifacts, so encode time matters more than a few bytes.
+    img.save(png_path, format="PNG", compress_level=1)
 
 
-def build_sprite(svg_paths: List[Path]) -> None:
+def build_sprite(svgs: List[Tuple[Path, str, int]]) -> None:
     symbols = []
-    for path in svg_paths:
-        svg = path.read_text(encoding="utf-8")
-        # Strip outer <svg ...> wrapper
-        inner = svg.split("<svg", 1)[1]
-        inner = inner.split(">", 1)[1].rsplit("</svg>", 1)[0]
-        symbols.append(f"  <symbol id='{path.stem}' viewBox='0 0 {extract_size(svg)[0]} {HEIGHT}'>\n{inner}\n  </symbol>")
+    for path, inner, width in svgs:
+        symbols.append(f"  <symbol id='{path.stem}' viewBox='0 0 {width} {HEIGHT}'>\n{inner}\n  </symbol>")
     sprite = "\n".join([
         "<svg xmlns='http://www.w3.org/2000/svg' aria-hidden='true'>",
         *symbols,
@@ -269,41 +311,57 @@ def build_sprite(svg_paths: List[Path]) -> None:
     SPRITE_PATH.write_text(sprite, encoding="utf-8")
 
 
-def extract_size(svg: str) -> (int, int):
-    # naive parse of width/height from the <svg ...> header
-    import re
+def write_pngs(png_jobs: List[Tuple[Path, str, int, int, str, str, float]]) -> None:
+    if not cairosvg:
+        # The Pillow renders take a few ms each; pool startup (and re-importing PIL/NumPy per
+        # worker on spawn platforms) costs far more than rendering them one after another.
+        for job in png_jobs:
+            write_png(*job)
+        return
+
+    # Only the cairosvg calls go to threads. cairocffi releases the GIL inside libcairo, but at
+    # these sizes much of cairosvg's time is Python-level SVG/CSS parsing, so the overlap (and any
+    # speedup) is not measured or guaranteed.
+    with ThreadPoolExecutor(max_workers=min(len(png_jobs), os.cpu_count() or 1)) as pool:
+        rendered = list(pool.map(_write_png_cairosvg_job, png_jobs))
+
+    # Failed renders fall back to Pillow here on the calling thread, so the lru_cached load_font
+    # faces and left_chip images are never used from more than one thread.
+    for (svg_path, _, width, height, label, scale_label, scale), ok in zip(png_jobs, rendered):
+        if not ok:
+            _write_png_fallback(svg_path, width, height, label, scale, png_path_for(svg_path, scale_label))
+
 
-    width_match = re.search(r"width='(\d+)'", svg)
-    height_match = re.search(r"height='(\d+)'", svg)
-    return int(width_match.group(1)), int(height_match.group(1))
+def _write_png_cairosvg_job(job: Tuple[Path, str, int, int, str, str, float]) -> bool:
+    svg_path, svg, width, height, _, scale_label, _ = job
+    return _write_png_cairosvg(svg_path, svg, width, height, png_path_for(svg_path, scale_label))
 
 
 def main() -> None:
-    svg_paths = []
+    svgs = []
+    png_jobs = []
+    manifest = {"badges": []}
+    # Single pass over BADGES; PNGs are rendered afterwards from the collected jobs.
     for label in BADGES:
-        svg = build_svg(label)
+        svg, inner, width = build_svg(label)
         path = write_svg(label, svg)
-        svg_paths.append(path)
-
-    for scale_label, scale in PNG_SCALES.items():
-        for path, label in zip(svg_paths, BADGES):
-            width, _ = extract_size(path.read_text(encoding="utf-8"))
-            write_png(path, int(width * scale), int(HEIGHT * scale), label, scale_label, scale)
-
-    build_sprite(svg_paths)
-
-    manifest = {
-        "badges": [
-            {
-                "label": label,
-                "slug": slugify(label),
-                "path": f"badges/svg/{slugify(label)}.svg",
-            }
-            for label in BADGES
-        ]
-    }
-    (ROOT / "badges" / "index.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
-    print(f"Wrote {len(svg_paths)} SVGs, sprite, and manifest.")
+        for scale_label, scale in PNG_SCALES.items():
+            png_jobs.append((path, svg, int(width * scale), int(HEIGHT * scale), label, scale_label, scale))
+        svgs.append((path, inner, width))
+        slug = slugify(label)
+        manifest["badges"].append({"label": label, "slug": slug, "path": f"badges/svg/{slug}.svg"})
+
+    write_pngs(png_jobs)
+
+    build_sprite(svgs)
+
+    manifest_path = ROOT / "badges" / "index.json"
+    if orjson:
+        manifest_path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    else:
+        # ensure_ascii=False keeps the stdlib output byte-identical to orjson's UTF-8.
+        manifest_path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"Wrote {len(svgs)} SVGs, sprite, and manifest.")
     if cairosvg:
         print("PNG exports created (2x).")
 